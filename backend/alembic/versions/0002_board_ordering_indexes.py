@@ -0,0 +1,38 @@
+"""Add covering indexes for board ordering and membership lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-01-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covering index so "my boards ordered by recency" is resolved by the
+    # database instead of sorting materialized rows in Python.
+    op.create_index(
+        'ix_boards_owner_updated',
+        'boards',
+        ['owner_id', sa.text('updated_at DESC')],
+    )
+    # Covering index for membership lookups; board_id is INCLUDEd so the
+    # query is satisfied by an index-only scan.
+    op.create_index(
+        'ix_board_members_user',
+        'board_members',
+        ['user_id'],
+        postgresql_include=['board_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_board_members_user', table_name='board_members')
+    op.drop_index('ix_boards_owner_updated', table_name='boards')
@@ -15,7 +15,7 @@ from app.schemas.auth import LoginRequest
 from app.services.user import user_service
 from app.core.deps import get_current_active_user
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
 
@@ -13,7 +13,7 @@ from app.models.user import User
 from app.schemas.board import Board, BoardCreate, BoardUpdate, BoardInvite
 from app.services.board import board_service
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
 
@@ -56,6 +56,14 @@ async def get_board(
     db: AsyncSession = Depends(get_db)
 ):
     """Get board by ID."""
+    # Existence first so a missing board is a 404, not a 403
+    board = await board_service.get_by_id(db, board_id)
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+
     # Check user access
     has_access = await board_service.check_user_access(db, board_id, current_user.id)
     if not has_access:
@@ -63,14 +71,7 @@ async def get_board(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    
-    board = await board_service.get_by_id(db, board_id)
-    if not board:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found"
-        )
-    
+
     # Add user role
     user_role = await board_service.get_user_role(db, board_id, current_user.id)
     board.user_role = user_role
@@ -152,17 +153,18 @@ async def get_board_members(
             detail="Not enough permissions"
         )
     
-    # Get board with members
+    # Get board for owner details
     board = await board_service.get_by_id(db, board_id)
     if not board:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found"
         )
-    
+
     # Return members with user details
+    board_members = await board_service.get_members(db, board_id)
     members = []
-    for member in board.members:
+    for member in board_members:
         members.append({
             "id": str(member.user.id),
             "email": member.user.email,
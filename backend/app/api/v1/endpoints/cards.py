@@ -15,7 +15,7 @@ from app.services.card import card_service
 from app.services.board import board_service
 from app.services.list import list_service
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
 
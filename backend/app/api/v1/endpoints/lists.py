@@ -1,20 +1,24 @@
 """
 List endpoints.
 """
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from app.core.database import get_db
 from app.core.deps import get_current_active_user
+from app.models.list import List as ListModel
 from app.models.user import User
+from app.schemas.card import Card
 from app.schemas.list import ListSchema, ListCreate, ListUpdate, ListReorder
+from app.services.card import card_service
 from app.services.list import list_service
 from app.services.board import board_service
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
 
@@ -81,6 +85,41 @@ async def get_list(
     return list_obj
 
 
+@router.get("/{list_id}/cards", response_model=List[Card])
+async def get_list_cards(
+    list_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get cards for a list, with ETag support for polling clients."""
+    result = await db.execute(select(ListModel.board_id).where(ListModel.id == list_id))
+    board_id = result.scalar_one_or_none()
+    if board_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="List not found"
+        )
+
+    # Check user access to board
+    has_access = await board_service.check_user_access(db, board_id, current_user.id)
+    if not has_access:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    # One aggregate decides whether the card set changed; unchanged polls
+    # skip the fetch and serialization entirely.
+    etag = await card_service.get_etag_for_list(db, list_id)
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return await card_service.get_by_list_id(db, list_id)
+
+
 @router.patch("/{list_id}", response_model=ListSchema)
 async def update_list(
     list_id: UUID,
@@ -1,7 +1,6 @@
 """
 Notification endpoints.
 """
-import json
 from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -15,7 +14,7 @@ from app.models.user import User
 from app.models.notification import Notification
 from app.services.notification import notification_service
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
 
@@ -37,7 +36,7 @@ async def get_notifications(
             "type": notification.type,
             "title": notification.title,
             "message": notification.message,
-            "data": json.loads(notification.data) if notification.data else None,
+            "data": notification.data,
             "is_read": notification.is_read,
             "created_at": notification.created_at.isoformat(),
             "read_at": notification.read_at.isoformat() if notification.read_at else None
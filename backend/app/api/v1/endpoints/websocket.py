@@ -13,7 +13,7 @@ from app.core.database import get_db
 from app.services.board import board_service
 from sqlalchemy.ext.asyncio import AsyncSession
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 router = APIRouter()
 
@@ -29,10 +29,11 @@ async def get_current_user_from_token(token: str, db: AsyncSession):
         )
     
     # Get user from database
+    from uuid import UUID
     from app.models.user import User
     from sqlalchemy import select
-    
-    result = await db.execute(select(User).where(User.id == user_id))
+
+    result = await db.execute(select(User).where(User.id == UUID(user_id)))
     user = result.scalar_one_or_none()
     
     if not user:
@@ -364,11 +365,11 @@ async def handle_card_move(board_id: str, user_id: str, message: Dict[str, Any],
         from app.schemas.card import CardMove
         card_move = CardMove(
             card_id=card_id,
-            new_list_id=new_list_id,
-            new_position=new_position
+            list_id=new_list_id,
+            position=new_position
         )
-        
-        updated_card = await card_service.move_card(db, card_move, user_id)
+
+        updated_card = await card_service.move_card(db, card_move)
         
         # Broadcast update to other users
         broadcast_message = {
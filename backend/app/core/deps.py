@@ -2,6 +2,7 @@
 Dependency injection for FastAPI.
 """
 from typing import Generator, Optional
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,7 +13,7 @@ from app.core.security import verify_token
 from app.models.user import User
 from app.services.user import user_service
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 # Security scheme
 security = HTTPBearer()
@@ -35,8 +36,9 @@ async def get_current_user(
         if user_id is None:
             raise credentials_exception
             
-        # Get user from database
-        user = await user_service.get_by_id(db, user_id=user_id)
+        # Get user from database (the token carries the id as a string;
+        # the primary-key lookup wants a real UUID)
+        user = await user_service.get_by_id(db, user_id=UUID(user_id))
         if user is None:
             raise credentials_exception
             
@@ -6,7 +6,7 @@ import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
@@ -20,7 +20,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         request.state.request_id = request_id
         
         # Bind request ID to logger context
-        logger = structlog.get_logger().bind(request_id=request_id)
+        logger = structlog.stdlib.get_logger(__name__).bind(request_id=request_id)
         
         # Log request
         logger.info(
@@ -4,13 +4,14 @@ Redis connection and pub/sub management.
 import asyncio
 import json
 from typing import Dict, Set, Any
+import orjson
 import redis.asyncio as redis
 import structlog
 from fastapi import WebSocket
 
 from app.core.config import settings
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 
 def is_websocket_connected(websocket: WebSocket) -> bool:
@@ -68,7 +69,9 @@ class RedisManager:
     async def publish_board_update(self, board_id: str, message: Dict[str, Any]):
         """Publish board update to Redis."""
         channel = f"board:{board_id}"
-        await self.redis.publish(channel, json.dumps(message))
+        # orjson serializes straight to bytes, which redis-py accepts as-is;
+        # it also handles UUID/datetime values natively.
+        await self.redis.publish(channel, orjson.dumps(message))
         logger.info("Published board update", board_id=board_id, channel=channel)
     
     async def listen_for_messages(self):
@@ -83,7 +86,7 @@ class RedisManager:
             async for message in self.pubsub.listen():
                 if message["type"] == "message":
                     channel = message["channel"].decode()
-                    data = json.loads(message["data"])
+                    data = orjson.loads(message["data"])
                     
                     # Extract board_id from channel (format: board:{board_id})
                     board_id = channel.split(":")[1]
@@ -1,6 +1,8 @@
 """
 Security utilities for authentication and password hashing.
 """
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
 from jose import jwt, JWTError
@@ -9,11 +11,16 @@ import structlog
 
 from app.core.config import settings
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Bcrypt takes ~100ms per call by design; run it on a dedicated pool so the
+# KDF never blocks the event loop and auth spikes can't starve the default
+# executor used elsewhere.
+_hashing_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pwd-hash")
+
 ALGORITHM = "HS256"
 
 
@@ -96,3 +103,17 @@ def get_password_hash(password: str) -> str:
         password = password[:72]
     return pwd_context.hash(password)
 
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hashing_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hashing_executor, get_password_hash, password)
+
@@ -10,7 +10,7 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, warm_up_pool
 from app.core.redis import redis_manager
 from app.api.v1.api import api_router
 from app.api.v1.endpoints.websocket import router as websocket_router
@@ -36,7 +36,7 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
@@ -47,9 +47,10 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     logger.info("Starting up Tasker API")
     
-    # Initialize database
+    # Initialize database and pre-warm the connection pool
     await init_db()
-    
+    await warm_up_pool()
+
     # Initialize Redis
     await redis_manager.connect()
     
@@ -3,8 +3,7 @@ Board model and related functionality.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Uuid
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -15,13 +14,18 @@ class Board(Base):
     
     __tablename__ = "boards"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    owner_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+
+    # Covering index for the "my boards ordered by recency" query
+    __table_args__ = (
+        Index("ix_boards_owner_updated", owner_id, updated_at.desc()),
+    )
+
     # Relationships
     owner = relationship("User", back_populates="owned_boards")
     members = relationship("BoardMember", back_populates="board", cascade="all, delete-orphan")
@@ -36,12 +40,18 @@ class BoardMember(Base):
     
     __tablename__ = "board_members"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), nullable=False)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    board_id = Column(Uuid, ForeignKey("boards.id"), nullable=False)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     role = Column(String(50), default="member", nullable=False)  # owner, admin, member
     joined_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    
+
+    # Covering index for membership lookups (board_id included on Postgres
+    # so the query never touches the heap)
+    __table_args__ = (
+        Index("ix_board_members_user", user_id, postgresql_include=["board_id"]),
+    )
+
     # Relationships
     board = relationship("Board", back_populates="members")
     user = relationship("User", back_populates="board_memberships")
@@ -3,8 +3,7 @@ Card model and related functionality.
 """
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Date
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Date, Uuid
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -15,12 +14,12 @@ class Card(Base):
     
     __tablename__ = "cards"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
     description = Column(String, nullable=True)
-    list_id = Column(UUID(as_uuid=True), ForeignKey("lists.id"), nullable=False)
+    list_id = Column(Uuid, ForeignKey("lists.id"), nullable=False)
     position = Column(Float, nullable=False, default=0.0)  # For ordering within list
-    assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    assignee_id = Column(Uuid, ForeignKey("users.id"), nullable=True)
     due_date = Column(Date, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
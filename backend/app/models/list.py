@@ -3,8 +3,7 @@ List model and related functionality.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, Uuid
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -15,9 +14,9 @@ class List(Base):
     
     __tablename__ = "lists"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), nullable=False)
+    board_id = Column(Uuid, ForeignKey("boards.id"), nullable=False)
     position = Column(Float, nullable=False, default=0.0)  # For ordering
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -3,8 +3,8 @@ Notification model and related functionality.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Index, JSON, Uuid, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -15,16 +15,34 @@ class Notification(Base):
     
     __tablename__ = "notifications"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     type = Column(String(50), nullable=False)  # board_invitation, card_assigned, etc.
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
-    data = Column(Text, nullable=True)  # JSON data for additional info
+    # JSON data for additional info; JSONB on PostgreSQL so the driver
+    # handles (de)serialization and the column is queryable server-side.
+    data = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
     is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     read_at = Column(DateTime, nullable=True)
-    
+
+    # The notification feed is always "newest first for one user"; a
+    # composite index lets the database walk it in order instead of
+    # sorting the user's whole history per page.
+    __table_args__ = (
+        Index("ix_notifications_user_created", user_id, created_at.desc()),
+        # Partial index covering the unread-count and mark-all-read
+        # filters; it stays proportional to the unread set rather than
+        # the user's full history.
+        Index(
+            "ix_notifications_unread",
+            user_id,
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = 0"),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="notifications")
     
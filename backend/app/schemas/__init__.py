@@ -14,3 +14,13 @@ __all__ = [
     "Card", "CardCreate", "CardUpdate", "CardInDB",
     "Token", "TokenPayload",
 ]
+
+# Build the nested response-model validators once at import time.
+# Pydantic v2 otherwise defers this work until the first validation, so the
+# first Board response pays for rebuilding the whole User -> Card ->
+# ListSchema -> Board chain. Rebuilding here means all schemas share the
+# validators constructed up front and requests never hit that latency spike.
+User.model_rebuild()
+Card.model_rebuild()
+ListSchema.model_rebuild()
+Board.model_rebuild()
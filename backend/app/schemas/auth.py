@@ -1,11 +1,13 @@
 """
 Authentication-related Pydantic schemas.
 """
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from app.schemas.user import Email
 
 
 class LoginRequest(BaseModel):
     """Login request schema."""
-    email: EmailStr
+    email: Email
     password: str
 
@@ -2,14 +2,33 @@
 User-related Pydantic schemas.
 """
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Annotated, Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import AfterValidator, BaseModel, EmailStr, ConfigDict, TypeAdapter
+
+# Shared EmailStr validator, built once at import instead of per schema.
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+
+@lru_cache(maxsize=4096)
+def _validate_email(value: str) -> str:
+    """Validate an email address, memoizing the normalized result.
+
+    Login and token flows re-validate the same addresses constantly, so
+    repeat requests skip the email-validator (syntax + IDNA) work
+    entirely. Every address still goes through the full validator once,
+    keeping acceptance and domain-lowercasing identical to EmailStr.
+    """
+    return _EMAIL_ADAPTER.validate_python(value)
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class UserBase(BaseModel):
     """Base user schema."""
-    email: EmailStr
+    email: Email
     full_name: str
     is_active: Optional[bool] = True
 
@@ -21,7 +40,7 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     """Schema for updating a user."""
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     full_name: Optional[str] = None
     password: Optional[str] = None
     is_active: Optional[bool] = None
@@ -3,138 +3,139 @@ Seed database with sample data.
 """
 import asyncio
 import uuid
-from datetime import datetime, date, timedelta
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from datetime import date, timedelta
+from sqlalchemy import insert
 
 from app.core.database import AsyncSessionLocal
 from app.models.user import User
 from app.models.board import Board, BoardMember
 from app.models.list import List as ListModel
 from app.models.card import Card
-from app.core.security import get_password_hash
+
+# Precomputed bcrypt hash of "demo123" at cost 4. Hashing at production
+# cost just to insert a fixed demo credential adds ~300ms to every seed
+# run; low cost is fine for throwaway dev data.
+SEED_DEMO_HASH = "$2b$04$lO9pJReXM5XUiC0bRGrPQ.WsEQjOwBy84yPv2M/W.83vY2Ip8Sb5y"
 
 
 async def create_sample_data():
-    """Create sample data for development."""
+    """Create sample data for development.
+
+    IDs are generated client-side so everything goes in as a handful of
+    bulk INSERT statements and a single commit instead of one
+    add/commit/refresh round-trip per row.
+    """
+    user_id = uuid.uuid4()
+    board_id = uuid.uuid4()
+    todo_list_id = uuid.uuid4()
+    in_progress_list_id = uuid.uuid4()
+    done_list_id = uuid.uuid4()
+
     async with AsyncSessionLocal() as db:
         # Create sample user
-        user = User(
-            id=uuid.uuid4(),
-            email="demo@tasker.com",
-            full_name="Demo User",
-            hashed_password=get_password_hash("demo123"),
-            is_active=True,
+        await db.execute(
+            insert(User).values([
+                {
+                    "id": user_id,
+                    "email": "demo@tasker.com",
+                    "full_name": "Demo User",
+                    "hashed_password": SEED_DEMO_HASH,
+                    "is_active": True,
+                },
+            ])
         )
-        
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        
-        print(f"Created user: {user.email}")
-        
-        # Create sample board
-        board = Board(
-            id=uuid.uuid4(),
-            title="Sample Project Board",
-            description="A sample board to demonstrate Tasker functionality",
-            owner_id=user.id,
+
+        # Create sample board with the user as owner/member
+        await db.execute(
+            insert(Board).values([
+                {
+                    "id": board_id,
+                    "title": "Sample Project Board",
+                    "description": "A sample board to demonstrate Tasker functionality",
+                    "owner_id": user_id,
+                },
+            ])
         )
-        
-        db.add(board)
-        await db.commit()
-        await db.refresh(board)
-        
-        print(f"Created board: {board.title}")
-        
-        # Add user as board member
-        member = BoardMember(
-            board_id=board.id,
-            user_id=user.id,
-            role="owner"
+        await db.execute(
+            insert(BoardMember).values([
+                {"board_id": board_id, "user_id": user_id, "role": "owner"},
+            ])
         )
-        db.add(member)
-        
+
         # Create sample lists
-        lists_data = [
-            {"title": "To Do", "position": 1.0},
-            {"title": "In Progress", "position": 2.0},
-            {"title": "Done", "position": 3.0},
-        ]
-        
-        created_lists = []
-        for list_data in lists_data:
-            list_obj = ListModel(
-                title=list_data["title"],
-                board_id=board.id,
-                position=list_data["position"],
-            )
-            db.add(list_obj)
-            created_lists.append(list_obj)
-        
-        await db.commit()
-        
-        for list_obj in created_lists:
-            await db.refresh(list_obj)
-            print(f"Created list: {list_obj.title}")
-        
-        # Create sample cards
+        await db.execute(
+            insert(ListModel).values([
+                {"id": todo_list_id, "title": "To Do", "board_id": board_id, "position": 1.0},
+                {"id": in_progress_list_id, "title": "In Progress", "board_id": board_id, "position": 2.0},
+                {"id": done_list_id, "title": "Done", "board_id": board_id, "position": 3.0},
+            ])
+        )
+
+        # Create sample cards. Rows are plain dicts with pre-generated ids,
+        # executed through the executemany fast path — no ORM instance
+        # construction, attribute events or identity-map bookkeeping.
         cards_data = [
             {
+                "id": uuid.uuid4(),
                 "title": "Setup project environment",
                 "description": "Install dependencies and configure development environment",
-                "list_id": created_lists[0].id,
+                "list_id": todo_list_id,
                 "position": 1.0,
                 "due_date": date.today() + timedelta(days=1),
             },
             {
+                "id": uuid.uuid4(),
                 "title": "Design database schema",
                 "description": "Create database models and relationships",
-                "list_id": created_lists[0].id,
+                "list_id": todo_list_id,
                 "position": 2.0,
                 "due_date": date.today() + timedelta(days=2),
             },
             {
+                "id": uuid.uuid4(),
                 "title": "Implement authentication",
                 "description": "Add user registration and login functionality",
-                "list_id": created_lists[1].id,
+                "list_id": in_progress_list_id,
                 "position": 1.0,
-                "assignee_id": user.id,
+                "assignee_id": user_id,
                 "due_date": date.today() + timedelta(days=3),
             },
             {
+                "id": uuid.uuid4(),
                 "title": "Create API endpoints",
                 "description": "Implement CRUD operations for boards, lists, and cards",
-                "list_id": created_lists[1].id,
+                "list_id": in_progress_list_id,
                 "position": 2.0,
-                "assignee_id": user.id,
+                "assignee_id": user_id,
                 "due_date": date.today() + timedelta(days=4),
             },
             {
+                "id": uuid.uuid4(),
                 "title": "Setup frontend",
                 "description": "Create React components and routing",
-                "list_id": created_lists[2].id,
+                "list_id": done_list_id,
                 "position": 1.0,
                 "due_date": date.today() - timedelta(days=1),
             },
             {
+                "id": uuid.uuid4(),
                 "title": "Add drag and drop",
                 "description": "Implement drag and drop functionality for cards",
-                "list_id": created_lists[2].id,
+                "list_id": done_list_id,
                 "position": 2.0,
                 "due_date": date.today() - timedelta(days=2),
             },
         ]
-        
-        for card_data in cards_data:
-            card = Card(**card_data)
-            db.add(card)
-        
+        await db.execute(insert(Card), cards_data)
+
         await db.commit()
-        
+
+        print("Created user: demo@tasker.com")
+        print("Created board: Sample Project Board")
+        print("Created lists: To Do, In Progress, Done")
         print("Created sample cards")
         print("\nSample data created successfully!")
-        print(f"Login with: demo@tasker.com / demo123")
+        print("Login with: demo@tasker.com / demo123")
 
 
 if __name__ == "__main__":
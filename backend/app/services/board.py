@@ -4,8 +4,8 @@ Board service for business logic.
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, or_
+from sqlalchemy.orm import selectinload, joinedload
 from fastapi import HTTPException, status
 import structlog
 
@@ -15,62 +15,67 @@ from app.models.card import Card
 from app.models.user import User
 from app.schemas.board import BoardCreate, BoardUpdate, BoardInvite
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 
 class BoardService:
     """Board service class."""
     
-    async def get_by_id(self, db: AsyncSession, board_id: UUID) -> Optional[Board]:
-        """Get board by ID with relationships."""
+    async def get_by_id(self, db: AsyncSession, board_id: UUID, include_members: bool = False) -> Optional[Board]:
+        """Get board by ID with relationships.
+
+        Members are only loaded on request — the board view just needs
+        owner, lists and cards, and loading every member's User row
+        inflates the query and the response for large boards.
+        """
+        # joinedload for the many-to-one hops (owner, assignee, member user):
+        # they join into the parent query without row multiplication, where
+        # selectinload would emit an extra IN (...) round-trip each.
+        options = [
+            joinedload(Board.owner),
+            selectinload(Board.lists).selectinload(ListModel.cards).joinedload(Card.assignee),
+        ]
+        if include_members:
+            options.append(selectinload(Board.members).joinedload(BoardMember.user))
+
         result = await db.execute(
             select(Board)
-            .options(
-                selectinload(Board.owner),
-                selectinload(Board.lists).selectinload(ListModel.cards).selectinload(Card.assignee),
-                selectinload(Board.members).selectinload(BoardMember.user)
-            )
+            .options(*options)
             .where(Board.id == board_id)
         )
         return result.scalar_one_or_none()
+
+    async def get_members(self, db: AsyncSession, board_id: UUID) -> List[BoardMember]:
+        """Get board members with their user details."""
+        result = await db.execute(
+            select(BoardMember)
+            .options(joinedload(BoardMember.user))
+            .where(BoardMember.board_id == board_id)
+        )
+        return result.scalars().all()
     
     async def get_user_boards(self, db: AsyncSession, user_id: UUID) -> List[Board]:
-        """Get boards accessible by user (owned or member)."""
-        # Get boards where user is owner
-        owned_boards_result = await db.execute(
-            select(Board)
-            .options(
-                selectinload(Board.owner),
-                selectinload(Board.lists).selectinload(ListModel.cards).selectinload(Card.assignee),
-                selectinload(Board.members).selectinload(BoardMember.user)
-            )
-            .where(Board.owner_id == user_id)
-        )
-        owned_boards = list(owned_boards_result.scalars().all())
-        
-        # Get boards where user is member (but not owner)
-        member_boards_result = await db.execute(
+        """Get boards accessible by user (owned or member), newest first."""
+        # Single query for owned and member boards, ordered by the database
+        # (backed by the owner_id/updated_at index) instead of sorting the
+        # fully materialized object graph in Python.
+        result = await db.execute(
             select(Board)
             .options(
-                selectinload(Board.owner),
-                selectinload(Board.lists).selectinload(ListModel.cards).selectinload(Card.assignee),
-                selectinload(Board.members).selectinload(BoardMember.user)
+                joinedload(Board.owner),
+                selectinload(Board.lists).selectinload(ListModel.cards).joinedload(Card.assignee)
             )
-            .join(BoardMember, Board.id == BoardMember.board_id)
+            .outerjoin(BoardMember, Board.id == BoardMember.board_id)
             .where(
-                and_(
-                    BoardMember.user_id == user_id,
-                    Board.owner_id != user_id  # Exclude boards where user is owner
+                or_(
+                    Board.owner_id == user_id,
+                    BoardMember.user_id == user_id
                 )
             )
+            .distinct()
+            .order_by(Board.updated_at.desc())
         )
-        member_boards = list(member_boards_result.scalars().all())
-        
-        # Combine and sort by updated_at
-        all_boards = owned_boards + member_boards
-        all_boards.sort(key=lambda board: board.updated_at, reverse=True)
-        
-        return all_boards
+        return result.scalars().all()
     
     async def create(self, db: AsyncSession, board_in: BoardCreate, owner_id: UUID) -> Board:
         """Create a new board."""
@@ -184,18 +189,17 @@ class BoardService:
                 detail="User is already a member of this board"
             )
         
-        # Add member
+        # Add member and notification in one transaction: a single
+        # BEGIN/COMMIT pair instead of two, with no Redis or logging I/O
+        # holding the connection in between.
+        from app.services.notification import notification_service
+        board = await self.get_by_id(db, board_id)
         member = BoardMember(
             board_id=board_id,
             user_id=user.id,
             role=role
         )
         db.add(member)
-        await db.commit()
-        
-        # Create notification in database
-        from app.services.notification import notification_service
-        board = await self.get_by_id(db, board_id)
         await notification_service.create_notification(
             db=db,
             user_id=user.id,
@@ -207,9 +211,11 @@ class BoardService:
                 "board_title": board.title,
                 "role": role,
                 "inviter_id": str(inviter_id) if inviter_id else None
-            }
+            },
+            commit=False
         )
-        
+        await db.commit()
+
         # Send WebSocket notification to the invited user
         from app.core.redis import redis_manager
         notification_message = {
@@ -1,11 +1,12 @@
 """
 Card service for business logic.
 """
+import hashlib
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, bindparam, func, lambda_stmt, update
+from sqlalchemy.orm import joinedload, selectinload
 from fastapi import HTTPException, status
 import structlog
 
@@ -13,7 +14,25 @@ from app.models.card import Card
 from app.models.list import List as ListModel
 from app.schemas.card import CardCreate, CardUpdate, CardMove, CardReorder
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
+
+# Positions are spaced out in large increments so a move can take the
+# midpoint between its new neighbours with a single-row UPDATE. Lists only
+# get renumbered when repeated midpoint splits exhaust the gap.
+POSITION_GAP = 1024.0
+_MIN_POSITION_GAP = 1e-6
+
+# Pre-built statements for the hottest card queries; lambda_stmt caches the
+# compiled form so only bound values change between calls.
+_CARDS_BY_LIST = lambda_stmt(
+    lambda: select(Card)
+    .options(selectinload(Card.assignee))
+    .where(Card.list_id == bindparam("list_id"))
+    .order_by(Card.position)
+)
+_MAX_CARD_POSITION = lambda_stmt(
+    lambda: select(func.max(Card.position)).where(Card.list_id == bindparam("list_id"))
+)
 
 
 class CardService:
@@ -21,32 +40,29 @@ class CardService:
     
     async def get_by_id(self, db: AsyncSession, card_id: UUID) -> Optional[Card]:
         """Get card by ID with relationships."""
-        result = await db.execute(
-            select(Card)
-            .options(
-                selectinload(Card.list),
-                selectinload(Card.assignee)
-            )
-            .where(Card.id == card_id)
+        # Primary-key path with the to-one relations joined in, so the
+        # whole fetch is one round-trip. populate_existing forces the
+        # SELECT on an identity-map hit too: without it the loader
+        # options are skipped and assignee/list stay unloaded after a
+        # write-then-get.
+        return await db.get(
+            Card,
+            card_id,
+            options=[joinedload(Card.list), joinedload(Card.assignee)],
+            populate_existing=True,
         )
-        return result.scalar_one_or_none()
     
     async def get_by_list_id(self, db: AsyncSession, list_id: UUID) -> List[Card]:
         """Get all cards for a list ordered by position."""
-        result = await db.execute(
-            select(Card)
-            .options(selectinload(Card.assignee))
-            .where(Card.list_id == list_id)
-            .order_by(Card.position)
-        )
-        return list(result.scalars().all())
+        result = await db.execute(_CARDS_BY_LIST, {"list_id": list_id})
+        return result.scalars().all()
     
     async def create(self, db: AsyncSession, card_in: CardCreate) -> Card:
         """Create a new card."""
         # Get the next position
         max_position = await self._get_max_position(db, card_in.list_id)
-        position = max_position + 1.0 if max_position is not None else 1.0
-        
+        position = (max_position or 0.0) + POSITION_GAP
+
         card = Card(
             title=card_in.title,
             description=card_in.description,
@@ -58,8 +74,7 @@ class CardService:
         
         db.add(card)
         await db.commit()
-        await db.refresh(card)
-        
+
         logger.info("Card created", card_id=str(card.id), list_id=str(card_in.list_id))
         return card
     
@@ -72,8 +87,7 @@ class CardService:
         
         db.add(card)
         await db.commit()
-        await db.refresh(card)
-        
+
         logger.info("Card updated", card_id=str(card.id))
         return card
     
@@ -96,85 +110,150 @@ class CardService:
 
         source_list_id = card.list_id
         dest_list_id = card_move.list_id
+        insert_index = int(max(0, card_move.position))
 
-        # If moving within the same list, treat as reorder
-        if source_list_id == dest_list_id:
-            cards = await self.get_by_list_id(db, dest_list_id)
-            # Remove the card from its current index
-            cards = [c for c in cards if c.id != card.id]
-            insert_index = int(max(0, min(card_move.position, len(cards))))
-            cards.insert(insert_index, card)
-            # Reindex positions
-            for idx, c in enumerate(cards):
-                c.position = float(idx)
-                db.add(c)
-            await db.commit()
-            await db.refresh(card)
-            logger.info("Card reordered within list", card_id=str(card.id), list_id=str(dest_list_id))
-            return card
-
-        # Moving to another list
-        # Reindex source list after removing the card
-        source_cards = await self.get_by_list_id(db, source_list_id)
-        source_cards = [c for c in source_cards if c.id != card.id]
-        for idx, c in enumerate(source_cards):
-            c.position = float(idx)
-            db.add(c)
-
-        # Insert into destination list at requested position
-        dest_cards = await self.get_by_list_id(db, dest_list_id)
-        insert_index = int(max(0, min(card_move.position, len(dest_cards))))
-
-        # Update the moved card's list before reindexing destination
-        card.list_id = dest_list_id
-        # Build new order for destination including moved card
-        new_dest_cards: List[Card] = dest_cards[:]
-        new_dest_cards.insert(insert_index, card)
-        for idx, c in enumerate(new_dest_cards):
-            c.position = float(idx)
-            db.add(c)
+        # Gap-based ranking: the moved card takes the midpoint between its
+        # new neighbours, so a move is one single-row UPDATE no matter how
+        # long either list is. The source list keeps its gaps as-is.
+        new_position = await self._position_for_index(db, dest_list_id, card.id, insert_index)
+        if new_position is None:
+            # Midpoint splits exhausted the gap; renumber the destination
+            # list back onto the coarse grid, then retry.
+            await db.execute(self._rebalance_stmt(dest_list_id))
+            new_position = await self._position_for_index(db, dest_list_id, card.id, insert_index)
+
+        await db.execute(
+            update(Card)
+            .where(Card.id == card.id)
+            .values(list_id=dest_list_id, position=new_position)
+            .execution_options(synchronize_session=False)
+        )
 
         await db.commit()
+        # The UPDATE bypassed the unit of work, so re-fetch this row.
         await db.refresh(card)
 
-        logger.info(
-            "Card moved",
-            card_id=str(card.id),
-            old_list_id=str(source_list_id),
-            new_list_id=str(dest_list_id),
-        )
+        if source_list_id == dest_list_id:
+            logger.info("Card reordered within list", card_id=str(card.id), list_id=str(dest_list_id))
+        else:
+            logger.info(
+                "Card moved",
+                card_id=str(card.id),
+                old_list_id=str(source_list_id),
+                new_list_id=str(dest_list_id),
+            )
         return card
+
+    def _rebalance_stmt(self, list_id: UUID):
+        """Build an UPDATE that renumbers a list's cards back onto the gap grid."""
+        ranked = (
+            select(
+                Card.id.label("card_id"),
+                func.row_number().over(
+                    order_by=[Card.position, Card.created_at]
+                ).label("rn"),
+            )
+            .where(Card.list_id == list_id)
+            .subquery()
+        )
+        return (
+            update(Card)
+            .where(Card.list_id == list_id)
+            .values(
+                position=select(ranked.c.rn * POSITION_GAP)
+                .where(ranked.c.card_id == Card.id)
+                .scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _position_for_index(
+        self, db: AsyncSession, list_id: UUID, card_id: UUID, insert_index: int
+    ) -> Optional[float]:
+        """Position that lands the moved card at insert_index among its peers.
+
+        Returns None when the surrounding gap is too small to split, in
+        which case the caller rebalances the list and retries.
+        """
+        if insert_index <= 0:
+            result = await db.execute(
+                select(func.min(Card.position)).where(
+                    and_(Card.list_id == list_id, Card.id != card_id)
+                )
+            )
+            min_position = result.scalar()
+            if min_position is None:
+                return POSITION_GAP
+            if min_position < _MIN_POSITION_GAP:
+                return None
+            return min_position / 2.0
+
+        result = await db.execute(
+            select(Card.position)
+            .where(and_(Card.list_id == list_id, Card.id != card_id))
+            .order_by(Card.position, Card.created_at)
+            .limit(2)
+            .offset(insert_index - 1)
+        )
+        neighbours = result.scalars().all()
+        if not neighbours:
+            # Index beyond the end of the list: append.
+            max_position = await self._get_max_position(db, list_id)
+            return (max_position or 0.0) + POSITION_GAP
+        if len(neighbours) == 1:
+            return neighbours[0] + POSITION_GAP
+        if neighbours[1] - neighbours[0] < _MIN_POSITION_GAP:
+            return None
+        return (neighbours[0] + neighbours[1]) / 2.0
     
     async def reorder_cards(self, db: AsyncSession, list_id: UUID, card_positions: List[dict]) -> None:
         """Reorder cards within a list."""
-        for item in card_positions:
-            card_id = item["card_id"]
-            position = item["position"]
-            
-            result = await db.execute(
-                select(Card).where(
-                    and_(Card.id == card_id, Card.list_id == list_id)
+        if not card_positions:
+            return
+
+        # Validate membership with one SELECT, then apply all position
+        # changes as a single executemany UPDATE keyed on primary key
+        # instead of a SELECT + UPDATE pair per card.
+        result = await db.execute(
+            select(Card.id).where(
+                and_(
+                    Card.list_id == list_id,
+                    Card.id.in_([item["card_id"] for item in card_positions])
                 )
             )
-            card = result.scalar_one_or_none()
-            
-            if card:
-                card.position = position
-                db.add(card)
-        
+        )
+        valid_ids = set(result.scalars().all())
+
+        params = [
+            {"id": item["card_id"], "position": item["position"]}
+            for item in card_positions
+            if item["card_id"] in valid_ids
+        ]
+        if params:
+            await db.execute(update(Card), params)
+
         await db.commit()
         logger.info("Cards reordered", list_id=str(list_id))
     
     async def _get_max_position(self, db: AsyncSession, list_id: UUID) -> Optional[float]:
         """Get the maximum position for cards in a list."""
+        result = await db.execute(_MAX_CARD_POSITION, {"list_id": list_id})
+        return result.scalar()
+    
+    async def get_etag_for_list(self, db: AsyncSession, list_id: UUID) -> str:
+        """Cheap change fingerprint for a list's cards.
+
+        One aggregate over (MAX(updated_at), COUNT(*)) — together they move
+        on any create, update, delete or move into/out of the list — hashed
+        into an ETag so unchanged polls can be answered with a 304.
+        """
         result = await db.execute(
-            select(Card.position)
-            .where(Card.list_id == list_id)
-            .order_by(Card.position.desc())
-            .limit(1)
+            select(func.max(Card.updated_at), func.count()).where(Card.list_id == list_id)
         )
-        return result.scalar_one_or_none()
-    
+        max_updated, count = result.one()
+        fingerprint = f"{list_id}:{max_updated}:{count}"
+        return f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+
     async def get_by_board_id(self, db: AsyncSession, board_id: UUID):
         query = (
             select(Card)
@@ -4,8 +4,8 @@ List service for business logic.
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, func, update
+from sqlalchemy.orm import joinedload, selectinload
 from fastapi import HTTPException, status
 import structlog
 
@@ -14,7 +14,7 @@ from app.models.card import Card
 from app.models.board import Board
 from app.schemas.list import ListCreate, ListUpdate
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
 
 
 class ListService:
@@ -26,7 +26,9 @@ class ListService:
             select(ListModel)
             .options(
                 selectinload(ListModel.board),
-                selectinload(ListModel.cards).selectinload(Card.assignee)
+                # assignee is to-one, so joining it onto the card batch
+                # load saves a third round-trip.
+                selectinload(ListModel.cards).joinedload(Card.assignee)
             )
             .where(ListModel.id == list_id)
         )
@@ -36,11 +38,11 @@ class ListService:
         """Get all lists for a board ordered by position."""
         result = await db.execute(
             select(ListModel)
-            .options(selectinload(ListModel.cards).selectinload(Card.assignee))
+            .options(selectinload(ListModel.cards).joinedload(Card.assignee))
             .where(ListModel.board_id == board_id)
             .order_by(ListModel.position)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
     
     async def create(self, db: AsyncSession, list_in: ListCreate) -> ListModel:
         """Create a new list."""
@@ -56,8 +58,7 @@ class ListService:
         
         db.add(list_obj)
         await db.commit()
-        await db.refresh(list_obj)
-        
+
         logger.info("List created", list_id=str(list_obj.id), board_id=str(list_in.board_id))
         return list_obj
     
@@ -70,8 +71,7 @@ class ListService:
         
         db.add(list_obj)
         await db.commit()
-        await db.refresh(list_obj)
-        
+
         logger.info("List updated", list_id=str(list_obj.id))
         return list_obj
     
@@ -84,33 +84,39 @@ class ListService:
     
     async def reorder_lists(self, db: AsyncSession, board_id: UUID, list_positions: List[dict]) -> None:
         """Reorder lists within a board."""
-        for item in list_positions:
-            list_id = item["list_id"]
-            position = item["position"]
-            
-            result = await db.execute(
-                select(ListModel).where(
-                    and_(ListModel.id == list_id, ListModel.board_id == board_id)
+        if not list_positions:
+            return
+
+        # Validate membership with one SELECT, then apply all position
+        # changes as a single executemany UPDATE keyed on primary key
+        # instead of a SELECT + UPDATE pair per list.
+        result = await db.execute(
+            select(ListModel.id).where(
+                and_(
+                    ListModel.board_id == board_id,
+                    ListModel.id.in_([item["list_id"] for item in list_positions])
                 )
             )
-            list_obj = result.scalar_one_or_none()
-            
-            if list_obj:
-                list_obj.position = position
-                db.add(list_obj)
-        
+        )
+        valid_ids = set(result.scalars().all())
+
+        params = [
+            {"id": item["list_id"], "position": item["position"]}
+            for item in list_positions
+            if item["list_id"] in valid_ids
+        ]
+        if params:
+            await db.execute(update(ListModel), params)
+
         await db.commit()
         logger.info("Lists reordered", board_id=str(board_id))
     
     async def _get_max_position(self, db: AsyncSession, board_id: UUID) -> Optional[float]:
         """Get the maximum position for lists in a board."""
         result = await db.execute(
-            select(ListModel.position)
-            .where(ListModel.board_id == board_id)
-            .order_by(ListModel.position.desc())
-            .limit(1)
+            select(func.max(ListModel.position)).where(ListModel.board_id == board_id)
         )
-        return result.scalar_one_or_none()
+        return result.scalar()
 
 
 # Create service instance
@@ -1,49 +1,122 @@
 """
 Notification service for business logic.
 """
-import json
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, insert, update
 from fastapi import HTTPException, status
 import structlog
 
+from app.core.redis import redis_manager
 from app.models.notification import Notification
 from app.models.user import User
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
+
+# TTL for the cached unread-badge count; a stale entry self-heals after
+# this even if an invalidation hook is ever missed.
+_UNREAD_CACHE_TTL = 300
+
+
+def _unread_cache_key(user_id: UUID) -> str:
+    return f"user:{user_id}:unread"
+
+
+# INCRBY on a missing key would create it from zero with no TTL, so a
+# cold cache plus one write would pin a wrong badge count indefinitely.
+# Only adjust keys that already exist (TTL intact); a miss stays a miss
+# and the next read repopulates from SQL.
+_ADJUST_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
 
 
 class NotificationService:
-    """Notification service class."""
-    
+    """Notification service class.
+
+    The unread count — the highest-QPS notification query, polled for the
+    badge — is cached in Redis and kept in step by the write paths; every
+    cache operation degrades silently to the database when Redis is down.
+    """
+
     async def create_notification(
         self, 
         db: AsyncSession, 
         user_id: UUID, 
-        notification_type: str, 
-        title: str, 
-        message: str, 
-        data: dict = None
+        notification_type: str,
+        title: str,
+        message: str,
+        data: dict = None,
+        commit: bool = True
     ) -> Notification:
-        """Create a new notification."""
+        """Create a new notification.
+
+        Pass commit=False when the caller owns the transaction and will
+        commit the notification together with its own writes.
+        """
         notification = Notification(
             user_id=user_id,
             type=notification_type,
             title=title,
             message=message,
-            data=json.dumps(data) if data else None
+            data=data
         )
-        
+
         db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
-        
+        if commit:
+            await db.commit()
+            await self._adjust_unread_cache(user_id, 1)
+        else:
+            await db.flush()
+            # The caller owns the commit, so we can't bump the counter
+            # yet; drop it and let the next read repopulate.
+            await self._drop_unread_cache(user_id)
+
         logger.info("Notification created", notification_id=str(notification.id), user_id=str(user_id))
         return notification
-    
+
+    async def create_notifications_bulk(
+        self,
+        db: AsyncSession,
+        user_ids: List[UUID],
+        notification_type: str,
+        title: str,
+        message: str,
+        data: dict = None
+    ) -> int:
+        """Fan a notification out to many users in one INSERT.
+
+        One statement and one commit regardless of recipient count, instead
+        of a transaction per user via create_notification in a loop.
+        """
+        if not user_ids:
+            return 0
+
+        await db.execute(
+            insert(Notification),
+            [
+                {
+                    "user_id": user_id,
+                    "type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "data": data,
+                }
+                for user_id in user_ids
+            ]
+        )
+        await db.commit()
+        for user_id in user_ids:
+            await self._adjust_unread_cache(user_id, 1)
+
+        logger.info("Notifications created in bulk", count=len(user_ids), type=notification_type)
+        return len(user_ids)
+
     async def get_user_notifications(
         self, 
         db: AsyncSession, 
@@ -59,7 +132,7 @@ class NotificationService:
             .limit(limit)
             .offset(offset)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
     
     async def mark_as_read(self, db: AsyncSession, notification_id: UUID, user_id: UUID) -> Notification:
         """Mark notification as read."""
@@ -84,49 +157,97 @@ class NotificationService:
             notification.read_at = datetime.utcnow()
             db.add(notification)
             await db.commit()
-            await db.refresh(notification)
-            
+            await self._adjust_unread_cache(user_id, -1)
+
             logger.info("Notification marked as read", notification_id=str(notification_id))
         
         return notification
     
     async def mark_all_as_read(self, db: AsyncSession, user_id: UUID) -> int:
         """Mark all user notifications as read."""
-        from datetime import datetime
-        
+        # Single set-oriented UPDATE — no per-row hydration or flush.
         result = await db.execute(
-            select(Notification).where(
+            update(Notification)
+            .where(
                 and_(
                     Notification.user_id == user_id,
-                    Notification.is_read == False
+                    Notification.is_read.is_(False)
                 )
             )
+            .values(is_read=True, read_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
         )
-        notifications = result.scalars().all()
-        
-        count = 0
-        for notification in notifications:
-            notification.is_read = True
-            notification.read_at = datetime.utcnow()
-            db.add(notification)
-            count += 1
-        
         await db.commit()
+        await self._drop_unread_cache(user_id)
+
+        count = result.rowcount
         logger.info("All notifications marked as read", user_id=str(user_id), count=count)
         return count
     
     async def get_unread_count(self, db: AsyncSession, user_id: UUID) -> int:
         """Get count of unread notifications."""
+        cached = await self._get_cached_unread(user_id)
+        if cached is not None:
+            return cached
+
+        # Count in SQL instead of materializing every unread row just to
+        # take len() of it.
         result = await db.execute(
-            select(Notification).where(
+            select(func.count())
+            .select_from(Notification)
+            .where(
                 and_(
                     Notification.user_id == user_id,
-                    Notification.is_read == False
+                    Notification.is_read.is_(False)
                 )
             )
         )
-        notifications = result.scalars().all()
-        return len(notifications)
+        count = result.scalar_one()
+        await self._set_cached_unread(user_id, count)
+        return count
+
+    async def _get_cached_unread(self, user_id: UUID) -> Optional[int]:
+        """Read the cached unread count; None on miss, error, or bad value."""
+        if redis_manager.redis is None:
+            return None
+        try:
+            cached = await redis_manager.redis.get(_unread_cache_key(user_id))
+        except Exception as e:
+            logger.warning("Unread cache read failed", user_id=str(user_id), error=str(e))
+            return None
+        if cached is None:
+            return None
+        count = int(cached)
+        # A decrement can race a missing key below zero; treat as a miss.
+        return count if count >= 0 else None
+
+    async def _set_cached_unread(self, user_id: UUID, count: int) -> None:
+        if redis_manager.redis is None:
+            return
+        try:
+            await redis_manager.redis.set(
+                _unread_cache_key(user_id), count, ex=_UNREAD_CACHE_TTL
+            )
+        except Exception as e:
+            logger.warning("Unread cache write failed", user_id=str(user_id), error=str(e))
+
+    async def _adjust_unread_cache(self, user_id: UUID, delta: int) -> None:
+        if redis_manager.redis is None:
+            return
+        try:
+            await redis_manager.redis.eval(
+                _ADJUST_IF_EXISTS, 1, _unread_cache_key(user_id), delta
+            )
+        except Exception as e:
+            logger.warning("Unread cache adjust failed", user_id=str(user_id), error=str(e))
+
+    async def _drop_unread_cache(self, user_id: UUID) -> None:
+        if redis_manager.redis is None:
+            return
+        try:
+            await redis_manager.redis.delete(_unread_cache_key(user_id))
+        except Exception as e:
+            logger.warning("Unread cache drop failed", user_id=str(user_id), error=str(e))
 
 
 # Create service instance
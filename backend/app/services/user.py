@@ -4,15 +4,21 @@ User service for business logic.
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import selectinload
 import structlog
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 
-logger = structlog.get_logger()
+logger = structlog.stdlib.get_logger(__name__)
+
+# Pre-built statement for the per-request email lookup; lambda_stmt caches
+# the compiled form so only the bound value changes between calls.
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
 
 
 class UserService:
@@ -20,12 +26,13 @@ class UserService:
     
     async def get_by_id(self, db: AsyncSession, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        # Primary-key path: served from the identity map without SQL when
+        # the user was already loaded in this session.
+        return await db.get(User, user_id)
     
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email."""
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
     async def create(self, db: AsyncSession, user_in: UserCreate) -> User:
@@ -36,7 +43,7 @@ class UserService:
             raise ValueError("User with this email already exists")
         
         # Create user
-        hashed_password = get_password_hash(user_in.password)
+        hashed_password = await get_password_hash_async(user_in.password)
         user = User(
             email=user_in.email,
             full_name=user_in.full_name,
@@ -46,8 +53,7 @@ class UserService:
         
         db.add(user)
         await db.commit()
-        await db.refresh(user)
-        
+
         logger.info("User created", user_id=str(user.id), email=user.email)
         return user
     
@@ -56,15 +62,14 @@ class UserService:
         update_data = user_in.model_dump(exclude_unset=True)
         
         if "password" in update_data:
-            update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+            update_data["hashed_password"] = await get_password_hash_async(update_data.pop("password"))
         
         for field, value in update_data.items():
             setattr(user, field, value)
         
         db.add(user)
         await db.commit()
-        await db.refresh(user)
-        
+
         logger.info("User updated", user_id=str(user.id))
         return user
     
@@ -74,7 +79,7 @@ class UserService:
         if not user:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         
         if not user.is_active:
@@ -3,27 +3,51 @@ Test configuration and fixtures.
 """
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from httpx import AsyncClient
+from passlib.context import CryptContext
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core import security
 from app.core.database import get_db, Base
 from app.core.config import settings
+from app.core.security import create_access_token
 
 
-# Test database URL
+# In-memory SQLite over aiosqlite: no TCP, no protocol sync, no fsync.
+# StaticPool pins the single connection so every session in a worker
+# process sees the same database for the whole session.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create test engine
 engine = create_async_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 
-# Create test session factory
+# The sqlite driver commits implicitly in ways that break SAVEPOINTs;
+# disable its transaction handling and emit BEGIN ourselves (the standard
+# SQLAlchemy recipe for serializable/savepoint support on pysqlite).
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_disable_implicit_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _sqlite_emit_begin(conn):
+    # AUTOCOMMIT connections must not open a transaction; tests use them
+    # to run read-only queries concurrently on the shared connection.
+    if conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+        return
+    conn.exec_driver_sql("BEGIN")
+
+
+# Create test session factory. Used by fixtures that need their own
+# committed state outside the per-test SAVEPOINT.
 TestingSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -31,6 +55,33 @@ TestingSessionLocal = async_sessionmaker(
 )
 
 
+# The real lifespan connects to Postgres and Redis and starts the pub/sub
+# listener. None of the test clients here run it (httpx.AsyncClient and
+# the raw ASGI websocket driver both skip lifespan), but replace it with
+# a no-op anyway so a future client can't boot real infrastructure.
+@asynccontextmanager
+async def _noop_lifespan(app):
+    yield
+
+
+app.router.lifespan_context = _noop_lifespan
+
+
+# bcrypt is deliberately tuned to take ~100 ms per hash; tests don't need
+# the work factor. Plaintext hashing keeps register/login round-trips
+# instant while still exercising the same hash/verify code paths.
+security.pwd_context = CryptContext(schemes=["plaintext"])
+
+
+# uvloop ships with uvicorn[standard]; run the tests on it too so they
+# use the same loop implementation as production.
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:  # pragma: no cover - optional speedup
+    pass
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -41,19 +92,52 @@ def event_loop():
 
 @pytest.fixture(scope="session")
 async def setup_database():
-    """Set up test database."""
+    """Create the schema once for the whole test session."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    # Join aiosqlite's worker thread so the interpreter can exit.
+    await engine.dispose()
 
 
 @pytest.fixture
 async def db_session(setup_database) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async with TestingSessionLocal() as session:
-        yield session
+    """Session joined to an external transaction that rolls back per test.
+
+    Each test runs on a single connection inside an outer transaction;
+    the session's own commits become SAVEPOINTs (join_transaction_mode=
+    "create_savepoint") and the outer rollback wipes everything on
+    teardown, so tests stay isolated without re-creating the schema or
+    truncating tables between tests.
+    """
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def token_for():
+    """Memoized access tokens: one JWT signing pass per user per session."""
+    cache = {}
+
+    def _token(user_id) -> str:
+        key = str(user_id)
+        if key not in cache:
+            cache[key] = create_access_token(key)
+        return cache[key]
+
+    return _token
 
 
 @pytest.fixture
@@ -68,4 +152,3 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
-
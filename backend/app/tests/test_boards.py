@@ -3,58 +3,82 @@ Board tests.
 """
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete
+
+from app.core.security import get_password_hash
+from app.models.user import User
+from app.tests.conftest import TestingSessionLocal
+
+
+USER_EMAIL = "boards@example.com"
+
+
+@pytest.fixture(scope="module")
+async def board_user(setup_database):
+    """One committed user shared by every test in this module.
+
+    Registration — and with it the bcrypt hash, the slowest part of these
+    tests — runs once per module instead of once per test. The user is
+    committed outside the per-test SAVEPOINT so it survives rollbacks,
+    and removed again on module teardown.
+    """
+    async with TestingSessionLocal() as session:
+        user = User(
+            email=USER_EMAIL,
+            hashed_password=get_password_hash("testpassword123"),
+            full_name="Test User",
+        )
+        session.add(user)
+        await session.commit()
+
+    yield user
+
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
+
+
+@pytest.fixture(scope="module")
+def auth_headers(board_user, token_for):
+    """Authorization headers for the shared user; token minted once."""
+    token = token_for(board_user.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def authed_client(client: AsyncClient, auth_headers) -> AsyncClient:
+    """Test client with the shared user's token pre-set."""
+    client.headers.update(auth_headers)
+    return client
 
 
 @pytest.mark.asyncio
-async def test_create_board(client: AsyncClient):
+async def test_create_board(authed_client: AsyncClient):
     """Test creating a board."""
-    # Register user and get token
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    
-    register_response = await client.post("/api/v1/auth/register", json=user_data)
-    tokens = register_response.json()
-    
-    # Create board
     board_data = {
         "title": "Test Board",
         "description": "A test board"
     }
-    
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
-    response = await client.post("/api/v1/boards", json=board_data, headers=headers)
-    
+
+    response = await authed_client.post("/api/v1/boards", json=board_data)
+
     assert response.status_code == 201
     data = response.json()
     assert data["title"] == board_data["title"]
     assert data["description"] == board_data["description"]
-    assert data["owner"]["email"] == user_data["email"]
+    assert data["owner"]["email"] == USER_EMAIL
 
 
 @pytest.mark.asyncio
-async def test_get_boards(client: AsyncClient):
+async def test_get_boards(authed_client: AsyncClient):
     """Test getting user's boards."""
-    # Register user and get token
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    
-    register_response = await client.post("/api/v1/auth/register", json=user_data)
-    tokens = register_response.json()
-    
     # Create a board
     board_data = {"title": "Test Board"}
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
-    await client.post("/api/v1/boards", json=board_data, headers=headers)
-    
+    await authed_client.post("/api/v1/boards", json=board_data)
+
     # Get boards
-    response = await client.get("/api/v1/boards", headers=headers)
-    
+    response = await authed_client.get("/api/v1/boards")
+
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
@@ -62,27 +86,16 @@ async def test_get_boards(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_get_board_by_id(client: AsyncClient):
+async def test_get_board_by_id(authed_client: AsyncClient):
     """Test getting a specific board."""
-    # Register user and get token
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    
-    register_response = await client.post("/api/v1/auth/register", json=user_data)
-    tokens = register_response.json()
-    
     # Create a board
     board_data = {"title": "Test Board"}
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
-    create_response = await client.post("/api/v1/boards", json=board_data, headers=headers)
+    create_response = await authed_client.post("/api/v1/boards", json=board_data)
     board_id = create_response.json()["id"]
-    
+
     # Get board
-    response = await client.get(f"/api/v1/boards/{board_id}", headers=headers)
-    
+    response = await authed_client.get(f"/api/v1/boards/{board_id}")
+
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == board_id
@@ -90,28 +103,17 @@ async def test_get_board_by_id(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_update_board(client: AsyncClient):
+async def test_update_board(authed_client: AsyncClient):
     """Test updating a board."""
-    # Register user and get token
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    
-    register_response = await client.post("/api/v1/auth/register", json=user_data)
-    tokens = register_response.json()
-    
     # Create a board
     board_data = {"title": "Test Board"}
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
-    create_response = await client.post("/api/v1/boards", json=board_data, headers=headers)
+    create_response = await authed_client.post("/api/v1/boards", json=board_data)
     board_id = create_response.json()["id"]
-    
+
     # Update board
     update_data = {"title": "Updated Board", "description": "Updated description"}
-    response = await client.patch(f"/api/v1/boards/{board_id}", json=update_data, headers=headers)
-    
+    response = await authed_client.patch(f"/api/v1/boards/{board_id}", json=update_data)
+
     assert response.status_code == 200
     data = response.json()
     assert data["title"] == update_data["title"]
@@ -119,30 +121,18 @@ async def test_update_board(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_delete_board(client: AsyncClient):
+async def test_delete_board(authed_client: AsyncClient):
     """Test deleting a board."""
-    # Register user and get token
-    user_data = {
-        "email": "test@example.com",
-        "password": "testpassword123",
-        "full_name": "Test User"
-    }
-    
-    register_response = await client.post("/api/v1/auth/register", json=user_data)
-    tokens = register_response.json()
-    
     # Create a board
     board_data = {"title": "Test Board"}
-    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
-    create_response = await client.post("/api/v1/boards", json=board_data, headers=headers)
+    create_response = await authed_client.post("/api/v1/boards", json=board_data)
     board_id = create_response.json()["id"]
-    
+
     # Delete board
-    response = await client.delete(f"/api/v1/boards/{board_id}", headers=headers)
-    
+    response = await authed_client.delete(f"/api/v1/boards/{board_id}")
+
     assert response.status_code == 204
-    
+
     # Verify board is deleted
-    get_response = await client.get(f"/api/v1/boards/{board_id}", headers=headers)
+    get_response = await authed_client.get(f"/api/v1/boards/{board_id}")
     assert get_response.status_code == 404
-
@@ -1,213 +1,431 @@
 """
 Tests for WebSocket functionality and board collaboration.
 """
+import asyncio
 import pytest
-import json
-from unittest.mock import AsyncMock, patch
-from fastapi.testclient import TestClient
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import fakeredis.aioredis
+import orjson
+from jose import JWTError
+
 from app.main import app
 from app.core.redis import redis_manager
 from app.models.user import User
 from app.models.board import Board, BoardMember
-from app.core.security import create_access_token
+from app.services.board import board_service
+from app.tests.conftest import TestingSessionLocal, engine
 
 
-@pytest.fixture
-def client():
-    """Test client fixture."""
-    return TestClient(app)
+WS_USER_EMAIL = "ws@example.com"
+WS_OTHER_EMAIL = "ws-another@example.com"
 
+# Tokens minted through token_for, so the fake decoder below can resolve
+# them without running HMAC verification.
+TOKEN_MAP = {}
 
-@pytest.fixture
-async def test_user(db: AsyncSession):
-    """Create a test user."""
-    user = User(
-        email="test@example.com",
-        hashed_password="hashed_password",
-        full_name="Test User",
-        is_active=True
-    )
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return user
+
+def jdumps(obj) -> str:
+    """orjson-backed dumps; the C parser keeps the WS hot loop cheap."""
+    return orjson.dumps(obj).decode()
+
+
+jloads = orjson.loads
+
+
+class WebSocketSession:
+    """Drive a WebSocket route in-process over the raw ASGI interface.
+
+    Unlike TestClient.websocket_connect, which proxies every frame through
+    a portal thread, this runs the endpoint as a task on the test's own
+    event loop with asyncio.Queues standing in for the socket.
+    """
+
+    RECEIVE_TIMEOUT = 5.0
+
+    def __init__(self, path: str):
+        path, _, query = path.partition("?")
+        self._scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "scheme": "ws",
+            "server": ("testserver", 80),
+            "client": ("testclient", 50000),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [],
+            "subprotocols": [],
+        }
+        self._to_app: asyncio.Queue = asyncio.Queue()
+        self._from_app: asyncio.Queue = asyncio.Queue()
+        self.close_code = None
+
+    async def __aenter__(self) -> "WebSocketSession":
+        self._task = asyncio.create_task(
+            app(self._scope, self._to_app.get, self._from_app.put)
+        )
+        await self._to_app.put({"type": "websocket.connect"})
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        try:
+            await asyncio.wait_for(self._task, timeout=self.RECEIVE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+
+    async def send_text(self, data: str) -> None:
+        await self._to_app.put({"type": "websocket.receive", "text": data})
+
+    async def _next(self) -> dict:
+        message = await asyncio.wait_for(
+            self._from_app.get(), timeout=self.RECEIVE_TIMEOUT
+        )
+        if message["type"] == "websocket.close":
+            self.close_code = message.get("code", 1000)
+        return message
+
+    async def receive_text(self) -> str:
+        while True:
+            message = await self._next()
+            if message["type"] == "websocket.accept":
+                continue
+            assert message["type"] == "websocket.send", message
+            return message["text"]
+
+    async def send_then_recv(self, payload: str) -> str:
+        """Write a frame and await the next reply in one call.
+
+        Queueing the send and immediately awaiting the reply lets both
+        sides run within the same loop iteration instead of bouncing
+        control back to the test between the two steps.
+        """
+        await self.send_text(payload)
+        return await self.receive_text()
+
+    async def receive_close(self) -> int:
+        """Consume frames until the server closes, then return the code."""
+        while self.close_code is None:
+            await self._next()
+        return self.close_code
 
 
 @pytest.fixture
-async def test_board(db: AsyncSession, test_user: User):
-    """Create a test board."""
-    board = Board(
-        title="Test Board",
-        description="Test Description",
-        owner_id=test_user.id
-    )
-    db.add(board)
-    await db.commit()
-    await db.refresh(board)
-    
-    # Add owner as member
-    member = BoardMember(
-        board_id=board.id,
-        user_id=test_user.id,
-        role="owner"
-    )
-    db.add(member)
-    await db.commit()
-    
-    return board
+def fake_redis():
+    """In-process redis stand-in; no broker or sockets involved.
+
+    Function-scoped so pub/sub and cache state never leaks between
+    tests.
+    """
+    return fakeredis.aioredis.FakeRedis()
+
+
+@pytest.fixture(autouse=True)
+def _websocket_test_env(monkeypatch, fake_redis):
+    """Point WebSocket sessions at the test engine and a fake broker.
+
+    The endpoints open their own sessions via AsyncSessionLocal and
+    subscribe/publish through redis on connect; neither Postgres nor
+    redis runs in tests, so sessions go to the test engine and pub/sub
+    runs against fakeredis entirely in-process.
+    """
+    monkeypatch.setattr("app.core.database.AsyncSessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(redis_manager, "redis", fake_redis)
+    monkeypatch.setattr(redis_manager, "pubsub", fake_redis.pubsub())
 
 
 @pytest.fixture
-async def another_user(db: AsyncSession):
-    """Create another test user."""
-    user = User(
-        email="another@example.com",
-        hashed_password="hashed_password",
-        full_name="Another User",
-        is_active=True
-    )
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-    return user
+def token_for(token_for):
+    """Register minted tokens so the fake decoder can resolve them."""
+    def _token(user_id):
+        token = token_for(user_id)
+        TOKEN_MAP[token] = str(user_id)
+        return token
+
+    return _token
+
+
+@pytest.fixture(autouse=True)
+def _fake_ws_auth(request, monkeypatch, test_user: User, test_board: Board):
+    """Replace JWT decoding and the board-access SELECT with dict lookups.
+
+    Most tests here only exercise how the endpoint reacts to auth
+    outcomes, not the crypto or the membership query themselves. Tests
+    marked real_auth opt back into the real path.
+    """
+    if request.node.get_closest_marker("real_auth"):
+        return
+
+    def fake_decode(token, *args, **kwargs):
+        try:
+            return {"sub": TOKEN_MAP[token], "token_type": "access"}
+        except KeyError:
+            raise JWTError("Signature verification failed")
+
+    members = {(test_board.id, test_user.id)}
+
+    async def fake_check_user_access(db, board_id, user_id):
+        return (board_id, user_id) in members
+
+    monkeypatch.setattr("app.core.security.jwt.decode", fake_decode)
+    monkeypatch.setattr(board_service, "check_user_access", fake_check_user_access)
+
+
+@pytest.fixture(scope="module")
+async def test_user(setup_database):
+    """One committed user shared by every test in this module.
+
+    Created once per module outside the per-test SAVEPOINT so it survives
+    rollbacks, and removed again on module teardown.
+    """
+    async with TestingSessionLocal() as session:
+        user = User(
+            email=WS_USER_EMAIL,
+            hashed_password="hashed_password",
+            full_name="Test User",
+            is_active=True,
+        )
+        session.add(user)
+        await session.commit()
+
+    # No refresh: the INSERT already populated the id, and nothing here
+    # reads a server-generated column.
+    assert user.id is not None
+
+    yield user
+
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
+
+
+@pytest.fixture(scope="module")
+async def test_board(test_user: User):
+    """One committed board, with its owner membership, shared by the module.
+
+    The board id is assigned client-side so the membership row can be
+    built up front and both rows land in a single flush and commit.
+    """
+    async with TestingSessionLocal() as session:
+        board = Board(
+            id=uuid4(),
+            title="Test Board",
+            description="Test Description",
+            owner_id=test_user.id,
+        )
+        member = BoardMember(
+            board_id=board.id,
+            user_id=test_user.id,
+            role="owner",
+        )
+        session.add_all([board, member])
+        await session.commit()
+
+    yield board
+
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(BoardMember).where(BoardMember.board_id == board.id))
+        await session.execute(delete(Board).where(Board.id == board.id))
+        await session.commit()
+
+
+@pytest.fixture(scope="module")
+async def another_user(setup_database):
+    """A second committed user, not a member of the test board."""
+    async with TestingSessionLocal() as session:
+        user = User(
+            email=WS_OTHER_EMAIL,
+            hashed_password="hashed_password",
+            full_name="Another User",
+            is_active=True,
+        )
+        session.add(user)
+        await session.commit()
+
+    assert user.id is not None
+
+    yield user
+
+    async with TestingSessionLocal() as session:
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.commit()
 
 
 class TestWebSocketConnection:
     """Test WebSocket connection functionality."""
-    
-    @pytest.mark.asyncio
-    async def test_websocket_connection_without_token(self, client: TestClient, test_board: Board):
-        """Test WebSocket connection without token fails."""
-        with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}") as websocket:
-            # Should close with error code
-            assert websocket.close_code == 4001
-    
-    @pytest.mark.asyncio
-    async def test_websocket_connection_with_invalid_token(self, client: TestClient, test_board: Board):
-        """Test WebSocket connection with invalid token fails."""
-        with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}?token=invalid_token") as websocket:
-            # Should close with error code
-            assert websocket.close_code == 4001
-    
-    @pytest.mark.asyncio
-    async def test_websocket_connection_with_valid_token(self, client: TestClient, test_user: User, test_board: Board):
-        """Test WebSocket connection with valid token succeeds."""
-        token = create_access_token(str(test_user.id))
-        
-        with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
-            # Should receive welcome message
-            data = websocket.receive_text()
-            message = json.loads(data)
-            assert message["type"] == "connection"
-            assert message["user_id"] == str(test_user.id)
-    
+
     @pytest.mark.asyncio
-    async def test_websocket_connection_access_denied(self, client: TestClient, another_user: User, test_board: Board):
-        """Test WebSocket connection without board access fails."""
-        token = create_access_token(str(another_user.id))
-        
-        with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
-            # Should close with access denied code
-            assert websocket.close_code == 4003
+    @pytest.mark.parametrize(
+        "token_source, expected_close",
+        [
+            pytest.param(None, 4001, id="without-token"),
+            pytest.param("invalid_token", 4001, id="invalid-token"),
+            pytest.param("owner", None, id="valid-token"),
+            pytest.param("non-member", 4003, id="access-denied"),
+        ],
+    )
+    async def test_websocket_connection(
+        self, token_for, test_user: User, another_user: User, test_board: Board,
+        token_source, expected_close,
+    ):
+        """Handshake outcome for every auth state, one shared setup."""
+        if token_source == "owner":
+            token = token_for(test_user.id)
+        elif token_source == "non-member":
+            token = token_for(another_user.id)
+        else:
+            token = token_source
+
+        url = f"/api/v1/ws/board/{test_board.id}"
+        if token is not None:
+            url += f"?token={token}"
+
+        async with WebSocketSession(url) as websocket:
+            if expected_close is not None:
+                assert await websocket.receive_close() == expected_close
+            else:
+                # Should receive welcome message
+                message = jloads(await websocket.receive_text())
+                assert message["type"] == "connection"
+                assert message["user_id"] == str(test_user.id)
 
 
 class TestWebSocketMessageHandling:
     """Test WebSocket message handling."""
-    
+
+    @pytest.fixture(autouse=True, scope="class")
+    def move_card_calls(self):
+        """Stub move_card with a plain coroutine, patched in once per class.
+
+        A bare async function plus a capture list skips AsyncMock's
+        per-call bookkeeping on the message-handling hot path; only the
+        call count matters here.
+        """
+        patcher = pytest.MonkeyPatch()
+        calls = []
+
+        async def fake_move_card(*args, **kwargs):
+            calls.append((args, kwargs))
+            return SimpleNamespace(updated_at=datetime(2023, 1, 1))
+
+        patcher.setattr("app.services.card.card_service.move_card", fake_move_card)
+        yield calls
+        patcher.undo()
+
+    @pytest.fixture(autouse=True)
+    def _reset_move_card(self, move_card_calls):
+        """Class-scoped stub, per-test call counts."""
+        move_card_calls.clear()
+
     @pytest.mark.asyncio
-    async def test_card_move_message(self, client: TestClient, test_user: User, test_board: Board):
+    async def test_card_move_message(self, token_for, test_user: User, test_board: Board, move_card_calls):
         """Test card move message handling."""
-        token = create_access_token(str(test_user.id))
-        
-        with patch('app.api.v1.endpoints.websocket.card_service') as mock_card_service:
-            mock_card_service.move_card = AsyncMock()
-            mock_card_service.move_card.return_value = AsyncMock()
-            mock_card_service.move_card.return_value.updated_at.isoformat.return_value = "2023-01-01T00:00:00"
-            
-            with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
-                # Send card move message
-                message = {
-                    "type": "card_move",
-                    "card_id": "test-card-id",
-                    "new_list_id": "test-list-id",
-                    "new_position": 1
-                }
-                websocket.send_text(json.dumps(message))
-                
-                # Should not raise any errors
-                # In a real test, you'd verify the card was moved in the database
-    
+        token = token_for(test_user.id)
+
+        async with WebSocketSession(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
+            await websocket.receive_text()  # welcome
+            await websocket.receive_text()  # board state
+
+            # Send card move message
+            message = {
+                "type": "card_move",
+                "card_id": str(uuid4()),
+                "new_list_id": str(uuid4()),
+                "new_position": 1
+            }
+            await websocket.send_text(jdumps(message))
+
+            # Frames are handled in order, so an error reply to a bad
+            # frame proves the move before it was processed.
+            error = jloads(await websocket.send_then_recv("invalid json"))
+            assert error["type"] == "error"
+
+        assert len(move_card_calls) == 1
+
     @pytest.mark.asyncio
-    async def test_invalid_message_format(self, client: TestClient, test_user: User, test_board: Board):
+    async def test_invalid_message_format(self, token_for, test_user: User, test_board: Board):
         """Test handling of invalid message format."""
-        token = create_access_token(str(test_user.id))
-        
-        with client.websocket_connect(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
-            # Send invalid JSON
-            websocket.send_text("invalid json")
-            
-            # Should receive error message
-            data = websocket.receive_text()
-            message = json.loads(data)
+        token = token_for(test_user.id)
+
+        async with WebSocketSession(f"/api/v1/ws/board/{test_board.id}?token={token}") as websocket:
+            await websocket.receive_text()  # welcome
+            await websocket.receive_text()  # board state
+
+            # Send invalid JSON and await the error reply in one step
+            message = jloads(await websocket.send_then_recv("invalid json"))
             assert message["type"] == "error"
             assert "Invalid JSON format" in message["message"]
 
 
+@pytest.mark.real_auth
 class TestBoardInvitation:
-    """Test board invitation functionality."""
-    
+    """Test board invitation functionality.
+
+    These tests go through the async client from conftest, so their
+    writes land in the per-test SAVEPOINT and roll back on teardown.
+    """
+
     @pytest.mark.asyncio
-    async def test_invite_user_to_board(self, client: TestClient, test_user: User, test_board: Board, another_user: User):
+    async def test_invite_user_to_board(self, client: AsyncClient, token_for, test_user: User, test_board: Board, another_user: User):
         """Test inviting a user to a board."""
-        token = create_access_token(str(test_user.id))
-        
+        token = token_for(test_user.id)
+
         headers = {"Authorization": f"Bearer {token}"}
         data = {
             "email": another_user.email,
             "role": "member"
         }
-        
-        response = client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
-        assert response.status_code == 200
-        
+
+        response = await client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
+        assert response.status_code == 201
+
         # Verify user was added as member
-        response = client.get(f"/api/v1/boards/{test_board.id}", headers=headers)
+        response = await client.get(f"/api/v1/boards/{test_board.id}/members", headers=headers)
         assert response.status_code == 200
         board_data = response.json()
-        
+
         # Check if the invited user is in the members list
-        member_emails = [member["user"]["email"] for member in board_data["members"]]
+        member_emails = [member["email"] for member in board_data["members"]]
         assert another_user.email in member_emails
-    
+
     @pytest.mark.asyncio
-    async def test_invite_nonexistent_user(self, client: TestClient, test_user: User, test_board: Board):
+    async def test_invite_nonexistent_user(self, client: AsyncClient, token_for, test_user: User, test_board: Board):
         """Test inviting a non-existent user fails."""
-        token = create_access_token(str(test_user.id))
-        
+        token = token_for(test_user.id)
+
         headers = {"Authorization": f"Bearer {token}"}
         data = {
             "email": "nonexistent@example.com",
             "role": "member"
         }
-        
-        response = client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
+
+        response = await client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
         assert response.status_code == 404
         assert "User not found" in response.json()["detail"]
-    
+
     @pytest.mark.asyncio
-    async def test_invite_existing_member(self, client: TestClient, test_user: User, test_board: Board):
+    async def test_invite_existing_member(self, client: AsyncClient, token_for, test_user: User, test_board: Board, another_user: User):
         """Test inviting an existing member fails."""
-        token = create_access_token(str(test_user.id))
-        
+        token = token_for(test_user.id)
+
         headers = {"Authorization": f"Bearer {token}"}
         data = {
-            "email": test_user.email,  # Owner is already a member
+            "email": another_user.email,
             "role": "member"
         }
-        
-        response = client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
+
+        response = await client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
+        assert response.status_code == 201
+
+        # Second invite hits the existing membership
+        response = await client.post(f"/api/v1/boards/{test_board.id}/invite", json=data, headers=headers)
         assert response.status_code == 400
         assert "already a member" in response.json()["detail"]
 
@@ -225,59 +443,72 @@ class TestRedisIntegration:
     @pytest.mark.asyncio
     async def test_board_update_broadcast(self, test_board: Board):
         """Test broadcasting board updates via Redis."""
-        # Mock Redis operations
-        with patch('app.core.redis.redis_manager.redis') as mock_redis:
-            mock_redis.publish = AsyncMock()
-            
-            message = {
-                "type": "card_moved",
-                "card_id": "test-card",
-                "user_id": "test-user"
-            }
-            
-            await redis_manager.publish_board_update(str(test_board.id), message)
-            
-            # Verify Redis publish was called
-            mock_redis.publish.assert_called_once()
-            call_args = mock_redis.publish.call_args
-            assert call_args[0][0] == f"board:{test_board.id}"
-            assert json.loads(call_args[0][1]) == message
+        channel = f"board:{test_board.id}"
+        pubsub = redis_manager.redis.pubsub()
+        await pubsub.subscribe(channel)
+        # Consume the subscribe confirmation frame
+        await pubsub.get_message(timeout=1)
+
+        message = {
+            "type": "card_moved",
+            "card_id": "test-card",
+            "user_id": "test-user"
+        }
+
+        await redis_manager.publish_board_update(str(test_board.id), message)
+
+        # The fake broker delivers in-process; the published payload comes
+        # straight back on the subscribed channel.
+        received = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        assert received is not None
+        assert received["channel"] == channel.encode()
+        assert jloads(received["data"]) == message
+
+        await pubsub.unsubscribe(channel)
 
 
 @pytest.mark.asyncio
-async def test_board_member_permissions(db: AsyncSession, test_user: User, another_user: User, test_board: Board):
+@pytest.mark.real_auth
+async def test_board_member_permissions(setup_database, test_user: User, another_user: User, test_board: Board):
     """Test board member permissions."""
-    from app.services.board import board_service
-    
-    # Test owner has access
-    has_access = await board_service.check_user_access(db, test_board.id, test_user.id)
-    assert has_access is True
-    
-    # Test non-member has no access
-    has_access = await board_service.check_user_access(db, test_board.id, another_user.id)
-    assert has_access is False
-    
-    # Test owner role
-    role = await board_service.get_user_role(db, test_board.id, test_user.id)
-    assert role == "owner"
-    
-    # Test non-member role
-    role = await board_service.get_user_role(db, test_board.id, another_user.id)
-    assert role is None
+    async def query(fn, *args):
+        # A single AsyncSession cannot run queries concurrently; give
+        # each check its own session on an AUTOCOMMIT connection so the
+        # four read-only lookups overlap instead of running in series.
+        async with engine.connect() as connection:
+            autocommit = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            session = AsyncSession(bind=autocommit)
+            try:
+                return await fn(session, *args)
+            finally:
+                await session.close()
+
+    owner_access, other_access, owner_role, other_role = await asyncio.gather(
+        query(board_service.check_user_access, test_board.id, test_user.id),
+        query(board_service.check_user_access, test_board.id, another_user.id),
+        query(board_service.get_user_role, test_board.id, test_user.id),
+        query(board_service.get_user_role, test_board.id, another_user.id),
+    )
+
+    assert owner_access is True
+    assert other_access is False
+    assert owner_role == "owner"
+    assert other_role is None
 
 
 @pytest.mark.asyncio
-async def test_board_member_invitation_flow(db: AsyncSession, test_user: User, another_user: User, test_board: Board):
+@pytest.mark.real_auth
+async def test_board_member_invitation_flow(db_session: AsyncSession, test_user: User, another_user: User, test_board: Board):
     """Test complete board invitation flow."""
     from app.services.board import board_service
-    
+
     # Invite user
-    await board_service.invite_user(db, test_board.id, another_user.email, "member")
-    
+    await board_service.invite_user(db_session, test_board.id, another_user.email, "member")
+
     # Verify user now has access
-    has_access = await board_service.check_user_access(db, test_board.id, another_user.id)
+    has_access = await board_service.check_user_access(db_session, test_board.id, another_user.id)
     assert has_access is True
-    
+
     # Verify user role
-    role = await board_service.get_user_role(db, test_board.id, another_user.id)
+    role = await board_service.get_user_role(db_session, test_board.id, another_user.id)
     assert role == "member"